@@ -0,0 +1,80 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C implementation of the hot string helpers of forminator_insert_generator.
+
+Build in place with:
+    cythonize -i _serialize.pyx
+
+When the extension is not built, the pure-Python implementations are used.
+"""
+
+from cpython.unicode cimport PyUnicode_GET_LENGTH, PyUnicode_KIND, PyUnicode_DATA, PyUnicode_READ
+from libc.stdlib cimport malloc, free
+
+
+cdef extern from "Python.h":
+    int PyUnicode_IS_ASCII(object o)
+    void PyUnicode_WRITE(int kind, void *data, Py_ssize_t index, Py_UCS4 value)
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+
+
+cdef Py_ssize_t _utf8_length(str value):
+    """Byte length of value once UTF-8 encoded, without encoding it."""
+    cdef Py_ssize_t length = PyUnicode_GET_LENGTH(value)
+    if PyUnicode_IS_ASCII(value):
+        return length
+
+    cdef int kind = PyUnicode_KIND(value)
+    cdef void *data = PyUnicode_DATA(value)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t byte_length = 0
+    cdef Py_UCS4 ch
+    for i in range(length):
+        ch = PyUnicode_READ(kind, data, i)
+        if ch < 0x80:
+            byte_length += 1
+        elif ch < 0x800:
+            byte_length += 2
+        elif ch < 0x10000:
+            byte_length += 3
+        else:
+            byte_length += 4
+    return byte_length
+
+
+cpdef str php_serialize_string(str value):
+    """
+    Create a PHP serialized string.
+    Format: s:length:"value"
+    Note: PHP uses byte length for UTF-8 strings
+    """
+    cdef Py_ssize_t byte_length = _utf8_length(value)
+    return f's:{byte_length}:"{value}"'
+
+
+cpdef str escape_sql_string(str value):
+    """Escape special characters for SQL string values."""
+    cdef Py_ssize_t length = PyUnicode_GET_LENGTH(value)
+    cdef int kind = PyUnicode_KIND(value)
+    cdef void *data = PyUnicode_DATA(value)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j = 0
+    cdef Py_UCS4 ch
+
+    # Quotes and backslashes are ASCII, so the escaped string keeps the same kind
+    cdef void *buffer = malloc(2 * length * kind + kind)
+    if buffer == NULL:
+        raise MemoryError()
+    try:
+        for i in range(length):
+            ch = PyUnicode_READ(kind, data, i)
+            if ch == u'\\' or ch == u"'":
+                PyUnicode_WRITE(kind, buffer, j, u'\\')
+                j += 1
+            PyUnicode_WRITE(kind, buffer, j, ch)
+            j += 1
+        if j == length:
+            return value
+        return PyUnicode_FromKindAndData(kind, buffer, j)
+    finally:
+        free(buffer)
@@ -4,8 +4,99 @@ Forminator Insert Query Generator
 Generates MySQL INSERT queries for WordPress Forminator plugin form entries.
 """
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    # Optional C implementation of the string helpers, see _serialize.pyx
+    import _serialize
+except ImportError:
+    _serialize = None
+
+
+# Serialized keys of the Stripe payment array, in Forminator order
+_STRIPE_KEY_PREFIXES = (
+    's:4:"mode";',
+    's:12:"product_name";',
+    's:12:"payment_type";',
+    's:6:"amount";',
+    's:8:"quantity";',
+    's:8:"currency";',
+    's:14:"transaction_id";',
+    's:16:"transaction_link";',
+    's:6:"status";',
+)
+
+
+# Serialized calculation-1 values (t-shirt fee), "€" is 3 bytes in UTF-8
+_CALC_ZERO = 'a:2:{s:6:"result";d:0;s:17:"formatting_result";s:5:"€ 0";}'
+_CALC_TWENTY = 'a:2:{s:6:"result";d:20;s:17:"formatting_result";s:6:"€ 20";}'
+_CALC_ZERO_BYTES = _CALC_ZERO.encode('utf-8')
+_CALC_TWENTY_BYTES = _CALC_TWENTY.encode('utf-8')
+
+# Gender codes and their full text
+_GENDER_MAP = {
+    'M': 'Masculin / Male',
+    'F': 'Féminin / Female'
+}
+
+
+@dataclass
+class _EntryContext:
+    """Values of a single form entry, shared by the field builders of the entry schema."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10) for faster attribute access
+    __slots__ = (
+        'entry_id', 'date_created', 'submission_date', 'first_name', 'last_name', 'email',
+        'phone', 'grade', 'dojo_name', 'birth_date', 'gender_value', 'stripe_transaction_id',
+        'stripe_amount', 'party', 't_shirt', 't_shirt_size', 'ffst_id', 'party_participants',
+        'currency',
+    )
+    
+    entry_id: int
+    date_created: str
+    submission_date: str
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    grade: str
+    dojo_name: str
+    birth_date: str
+    gender_value: str
+    stripe_transaction_id: str
+    stripe_amount: str
+    party: bool
+    t_shirt: bool
+    t_shirt_size: Optional[str]
+    ffst_id: Optional[str]
+    party_participants: str
+    currency: str
+
+
+def _checkbox_value(ctx: _EntryContext) -> str:
+    """Build the checkbox-2 value: party and/or t-shirt, comma-separated."""
+    checkbox_values = []
+    if ctx.party:
+        checkbox_values.append('Fête Finale / Final Party')
+    if ctx.t_shirt:
+        checkbox_values.append('T-Shirt')
+    return ', '.join(checkbox_values)
+
+
+def _now() -> str:
+    """Current datetime as a 'YYYY-MM-DD HH:MM:SS' timestamp, the default date_created."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+@lru_cache(maxsize=1024)
+def _submission_date(date_created: str) -> str:
+    """Convert a 'YYYY-MM-DD HH:MM:SS' timestamp to the DD/MM/YYYY submission date."""
+    return datetime.strptime(date_created, '%Y-%m-%d %H:%M:%S').strftime('%d/%m/%Y')
 
 
 class ForminatorInsertGenerator:
@@ -13,6 +104,87 @@ class ForminatorInsertGenerator:
     
     TABLE_NAME = "wp_frmt_form_entry_meta"
     
+    # Constant parts of the INSERT queries, precomputed once
+    _INSERT_HEAD = (
+        f"INSERT INTO `{TABLE_NAME}` "
+        f"(`entry_id`, `meta_key`, `meta_value`, `date_created`, `date_updated`) "
+        f"VALUES "
+    )
+    _INSERT_PREFIX = _INSERT_HEAD + "("
+    _ROW_SUFFIX = "', '0000-00-00 00:00:00')"
+    _INSERT_SUFFIX = _ROW_SUFFIX + ";"
+    
+    # Default number of entries above which bytes generation is spread over worker
+    # processes. Rendering takes ~25 µs per entry, so 1000 entries take about as long
+    # as starting a process pool and pickling the chunks: smaller runs cannot gain.
+    PARALLEL_THRESHOLD = 1000
+    
+    # Parameterized INSERT query for DB-API drivers (e.g. cursor.executemany())
+    PARAM_INSERT_QUERY = _INSERT_HEAD + "(%s, %s, %s, %s, '0000-00-00 00:00:00')"
+    
+    # UTF-8 encoded query fragments for the bytes output
+    _INSERT_PREFIX_BYTES = _INSERT_PREFIX.encode('utf-8')
+    _INSERT_SUFFIX_BYTES = _INSERT_SUFFIX.encode('utf-8')
+    
+    # Form fields in insertion order: (meta_key, value builder, optional inclusion predicate).
+    # Predicates may only read the entry options keying _entry_plan().
+    _ENTRY_SCHEMA = (
+        # 1. Hidden field (hidden-1) - Entry ID
+        ('hidden-1', lambda c: str(c.entry_id), None),
+        # 2. Hidden field (hidden-2) - Submission Date (DD/MM/YYYY)
+        ('hidden-2', lambda c: c.submission_date, None),
+        # 3. Text field (text-1) - FFST ID (optional)
+        ('text-1', lambda c: c.ffst_id, lambda c: c.ffst_id),
+        # 4. Calculation-1 field (always present - 20 if t_shirt, 0 otherwise)
+        ('calculation-1', lambda c: _CALC_TWENTY if c.t_shirt else _CALC_ZERO, None),
+        # 5. Calculation-2 field (always present - stripe amount)
+        ('calculation-2',
+         lambda c: ForminatorInsertGenerator.php_serialize_calculation_from_str(c.stripe_amount), None),
+        # 6. Name field (name-1) - PHP serialized array
+        ('name-1', lambda c: ForminatorInsertGenerator.php_serialize_name(c.first_name, c.last_name), None),
+        # 7. Email field (email-1)
+        ('email-1', lambda c: c.email, None),
+        # 8. Phone field (phone-1)
+        ('phone-1', lambda c: c.phone, None),
+        # 9. Grade field (select-1)
+        ('select-1', lambda c: c.grade, None),
+        # 10. Dojo Name field (text-3)
+        ('text-3', lambda c: c.dojo_name, None),
+        # 11. Birth Date field (date-1)
+        ('date-1', lambda c: c.birth_date, None),
+        # 12. Gender field (select-2) - only when t_shirt is True
+        ('select-2', lambda c: c.gender_value, lambda c: c.t_shirt),
+        # 13. T-Shirt Size field (select-3) - only when t_shirt is True and t_shirt_size is provided
+        ('select-3', lambda c: c.t_shirt_size, lambda c: c.t_shirt and c.t_shirt_size),
+        # 14. Select-4 field (conditional - only when t_shirt is True)
+        ('select-4', lambda c: '1', lambda c: c.t_shirt),
+        # 15. Select-5 field
+        ('select-5', lambda c: c.party_participants, lambda c: c.party),
+        # 16. Checkbox-2 field (optional - party and/or t-shirt)
+        ('checkbox-2', _checkbox_value, lambda c: c.party or c.t_shirt),
+        # 17. Stripe payment field (stripe-ocs-1) - PHP serialized array
+        ('stripe-ocs-1',
+         lambda c: ForminatorInsertGenerator.php_serialize_stripe(c.stripe_transaction_id, c.stripe_amount,
+                                                                  c.currency),
+         None),
+    )
+    
+    # Precompiled ", 'meta_key', '" row fragments of the bytes output
+    _META_KEY_FRAGMENTS_BYTES = {
+        meta_key: b", '" + meta_key.encode('utf-8') + b"', '" for meta_key, _, _ in _ENTRY_SCHEMA
+    }
+    
+    # Filtered _ENTRY_SCHEMA per combination of entry options, see _entry_plan()
+    _ENTRY_PLANS: Dict[Tuple[bool, bool, bool, bool], Tuple] = {}
+    
+    # Builders of the serialized fields for the bytes output, producing UTF-8 directly
+    _ENTRY_SCHEMA_BYTES = {
+        'calculation-1': lambda c: _CALC_TWENTY_BYTES if c.t_shirt else _CALC_ZERO_BYTES,
+        'calculation-2':
+            lambda c: ForminatorInsertGenerator.php_serialize_calculation_bytes_from_str(c.stripe_amount),
+        'name-1': lambda c: ForminatorInsertGenerator.php_serialize_name_bytes(c.first_name, c.last_name),
+    }
+    
     def __init__(self):
         """Initialize the generator."""
         pass
@@ -24,7 +196,8 @@ class ForminatorInsertGenerator:
         Format: s:length:"value"
         Note: PHP uses byte length for UTF-8 strings
         """
-        byte_length = len(value.encode('utf-8'))
+        # ASCII strings have as many bytes as characters, no need to encode them
+        byte_length = len(value) if value.isascii() else len(value.encode('utf-8'))
         return f's:{byte_length}:"{value}"'
     
     @staticmethod
@@ -37,18 +210,63 @@ class ForminatorInsertGenerator:
         last_serialized = ForminatorInsertGenerator.php_serialize_string(last_name)
         return f'a:2:{{s:10:"first-name";{first_serialized};s:9:"last-name";{last_serialized};}}'
     
+    @staticmethod
+    def php_serialize_string_bytes(value: str) -> bytes:
+        """
+        Create a UTF-8 encoded PHP serialized string.
+        Format: s:length:"value"
+        """
+        encoded = value.encode('utf-8')
+        return b's:%d:"%b"' % (len(encoded), encoded)
+    
+    @staticmethod
+    def php_serialize_name_bytes(first_name: str, last_name: str) -> bytes:
+        """UTF-8 encoded variant of php_serialize_name()."""
+        return b'a:2:{s:10:"first-name";%b;s:9:"last-name";%b;}' % (
+            ForminatorInsertGenerator.php_serialize_string_bytes(first_name),
+            ForminatorInsertGenerator.php_serialize_string_bytes(last_name),
+        )
+    
+    @staticmethod
+    def _calculation_values(amount: float, currency_symbol: str) -> Tuple[str, str]:
+        """Format the result and formatting_result values of a calculation field."""
+        return f"{amount}", f"{currency_symbol} {int(amount)}"
+    
+    @staticmethod
+    def php_serialize_calculation_bytes(amount: float, currency_symbol: str = "€") -> bytes:
+        """UTF-8 encoded variant of php_serialize_calculation()."""
+        result, formatted_amount = ForminatorInsertGenerator._calculation_values(amount, currency_symbol)
+        return b'a:2:{s:6:"result";d:%b;s:17:"formatting_result";%b;}' % (
+            result.encode('ascii'), ForminatorInsertGenerator.php_serialize_string_bytes(formatted_amount)
+        )
+    
     @staticmethod
     def php_serialize_calculation(amount: float, currency_symbol: str = "€") -> str:
         """
         Create a PHP serialized array for calculation field.
         Format: a:2:{s:6:"result";d:20;s:17:"formatting_result";s:6:"€ 20";}
         """
-        # Format the amount string
-        formatted_amount = f"{currency_symbol} {int(amount)}"
+        # Format the amount strings
+        result, formatted_amount = ForminatorInsertGenerator._calculation_values(amount, currency_symbol)
         formatted_serialized = ForminatorInsertGenerator.php_serialize_string(formatted_amount)
         
         # Build the serialized array
-        return f'a:2:{{s:6:"result";d:{amount};s:17:"formatting_result";{formatted_serialized};}}'
+        return f'a:2:{{s:6:"result";d:{result};s:17:"formatting_result";{formatted_serialized};}}'
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def php_serialize_calculation_from_str(amount: str, currency_symbol: str = "€") -> str:
+        """
+        Create a PHP serialized array for calculation field from a decimal string amount (e.g. "375.00").
+        Amounts are shared by many entries, so results are memoized.
+        """
+        return ForminatorInsertGenerator.php_serialize_calculation(float(amount), currency_symbol)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def php_serialize_calculation_bytes_from_str(amount: str, currency_symbol: str = "€") -> bytes:
+        """UTF-8 encoded variant of php_serialize_calculation_from_str(), memoized the same way."""
+        return ForminatorInsertGenerator.php_serialize_calculation_bytes(float(amount), currency_symbol)
     
     @staticmethod
     def php_serialize_stripe(transaction_id: str, amount: str, currency: str = "EUR", 
@@ -61,26 +279,53 @@ class ForminatorInsertGenerator:
         # Calculate the transaction link
         transaction_link = f"https://dashboard.stripe.com/payments/{transaction_id}"
         
-        parts = [
-            's:4:"mode";' + ForminatorInsertGenerator.php_serialize_string(mode),
-            's:12:"product_name";' + ForminatorInsertGenerator.php_serialize_string(product_name),
-            's:12:"payment_type";' + ForminatorInsertGenerator.php_serialize_string(payment_type),
-            's:6:"amount";' + ForminatorInsertGenerator.php_serialize_string(amount),
-            's:8:"quantity";' + ForminatorInsertGenerator.php_serialize_string("1"),
-            's:8:"currency";' + ForminatorInsertGenerator.php_serialize_string(currency),
-            's:14:"transaction_id";' + ForminatorInsertGenerator.php_serialize_string(transaction_id),
-            's:16:"transaction_link";' + ForminatorInsertGenerator.php_serialize_string(transaction_link),
-            's:6:"status";' + ForminatorInsertGenerator.php_serialize_string(status),
-        ]
-        
-        return 'a:9:{' + ';'.join(parts) + ';}'
+        serialize = ForminatorInsertGenerator.php_serialize_string
+        # Everything but the transaction is shared by many entries
+        serialize_repeated = ForminatorInsertGenerator._serialize_repeated
+        prefix = _STRIPE_KEY_PREFIXES
+        
+        # Single join over all fragments, separators included
+        return ''.join((
+            'a:9:{',
+            prefix[0], serialize_repeated(mode), ';',
+            prefix[1], serialize_repeated(product_name), ';',
+            prefix[2], serialize_repeated(payment_type), ';',
+            prefix[3], serialize_repeated(amount), ';',
+            prefix[4], serialize_repeated("1"), ';',
+            prefix[5], serialize_repeated(currency), ';',
+            prefix[6], serialize(transaction_id), ';',
+            prefix[7], serialize(transaction_link), ';',
+            prefix[8], serialize_repeated(status), ';}',
+        ))
     
     @staticmethod
     def escape_sql_string(value: str) -> str:
         """Escape special characters for SQL string values."""
+        # Most values contain neither character and are returned as is
+        if "'" not in value and '\\' not in value:
+            return value
         # Escape single quotes and backslashes
         return value.replace('\\', '\\\\').replace("'", "\\'")
     
+    @staticmethod
+    def escape_sql_bytes(value: bytes) -> bytes:
+        """Escape special characters for UTF-8 encoded SQL string values."""
+        # Quotes and backslashes never occur inside UTF-8 multi-byte sequences
+        return value.replace(b'\\', b'\\\\').replace(b"'", b"\\'")
+    
+    if _serialize is not None:
+        # Use the compiled implementations when the extension is built
+        php_serialize_string = staticmethod(_serialize.php_serialize_string)
+        escape_sql_string = staticmethod(_serialize.escape_sql_string)
+    
+    # Stripe values shared by many entries (mode, amount, currency...) are memoized;
+    # unique values such as transaction IDs are not.
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _serialize_repeated(value: str) -> str:
+        """Memoized php_serialize_string() for values that repeat across entries."""
+        return ForminatorInsertGenerator.php_serialize_string(value)
+    
     def generate_insert_query(self, entry_id: int, meta_key: str, 
                              meta_value: str, date_created: Optional[str] = None) -> str:
         """
@@ -96,19 +341,47 @@ class ForminatorInsertGenerator:
             MySQL INSERT query string
         """
         if date_created is None:
-            date_created = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            date_created = _now()
         
         # Escape the meta_value for SQL
         escaped_value = self.escape_sql_string(meta_value)
         
-        query = (
-            f"INSERT INTO `{self.TABLE_NAME}` "
-            f"(`entry_id`, `meta_key`, `meta_value`, `date_created`, `date_updated`) "
-            f"VALUES "
-            f"({entry_id}, '{meta_key}', '{escaped_value}', '{date_created}', '0000-00-00 00:00:00');"
-        )
+        return ''.join((
+            self._INSERT_PREFIX, str(entry_id), ", '", meta_key, "', '",
+            escaped_value, "', '", date_created, self._INSERT_SUFFIX
+        ))
+    
+    def generate_values_row(self, entry_id: int, meta_key: str,
+                            meta_value: str, date_created: str) -> str:
+        """
+        Generate the VALUES tuple of a form entry meta row, e.g.
+        (338, 'email-1', 'john.doe@example.com', '2025-10-18 14:25:49', '0000-00-00 00:00:00')
+        """
+        # Escape the meta_value for SQL
+        escaped_value = self.escape_sql_string(meta_value)
+        return ''.join((
+            "(", str(entry_id), ", '", meta_key, "', '",
+            escaped_value, "', '", date_created, self._ROW_SUFFIX
+        ))
+    
+    def generate_batched_insert_queries(self, rows: List[str], batch_size: int = 1000) -> List[str]:
+        """
+        Group VALUES rows into multi-row INSERT queries.
+        
+        Args:
+            rows: VALUES tuples as returned by generate_values_row()
+            batch_size: Maximum number of rows per INSERT query
+        
+        Returns:
+            List of MySQL INSERT query strings
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         
-        return query
+        return [
+            self._INSERT_HEAD + ','.join(rows[start:start + batch_size]) + ';'
+            for start in range(0, len(rows), batch_size)
+        ]
     
     def generate_entry_inserts(
         self,
@@ -157,132 +430,201 @@ class ForminatorInsertGenerator:
         Returns:
             List of MySQL INSERT query strings
         """
-        if date_created is None:
-            date_created = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Convert gender code to full text
-        gender_map = {
-            'M': 'Masculin / Male',
-            'F': 'Féminin / Female'
+        entry = {
+            'entry_id': entry_id,
+            'first_name': first_name,
+            'last_name': last_name,
+            'email': email,
+            'phone': phone,
+            'grade': grade,
+            'dojo_name': dojo_name,
+            'birth_date': birth_date,
+            'gender': gender,
+            'stripe_transaction_id': stripe_transaction_id,
+            'stripe_amount': stripe_amount,
+            'party': party,
+            't_shirt': t_shirt,
+            't_shirt_size': t_shirt_size,
+            'ffst_id': ffst_id,
+            'party_participants': party_participants,
+            'date_created': date_created,
+            'currency': currency,
         }
-        gender_value = gender_map.get(gender, gender)  # Use mapped value or original if not M/F
-        
-        queries = []
-        
-        # Generate the submission date in DD/MM/YYYY format for hidden-2
-        if date_created:
-            # Parse the date_created and convert to DD/MM/YYYY format
-            from datetime import datetime as dt
-            dt_obj = dt.strptime(date_created, '%Y-%m-%d %H:%M:%S')
-            submission_date = dt_obj.strftime('%d/%m/%Y')
-        else:
-            submission_date = datetime.now().strftime('%d/%m/%Y')
-        
-        # 1. Hidden field (hidden-1) - Entry ID
-        queries.append(self.generate_insert_query(
-            entry_id, 'hidden-1', str(entry_id), date_created
-        ))
-        
-        # 2. Hidden field (hidden-2) - Submission Date (DD/MM/YYYY)
-        queries.append(self.generate_insert_query(
-            entry_id, 'hidden-2', submission_date, date_created
-        ))
-        
-        # 3. Text field (text-1) - FFST ID (optional)
-        if ffst_id:
-            queries.append(self.generate_insert_query(
-                entry_id, 'text-1', ffst_id, date_created
-            ))
-        
-        # 4. Calculation-1 field (always present - 20 if t_shirt, 0 otherwise)
-        calculation_amount = 20 if t_shirt else 0
-        calculation_value = self.php_serialize_calculation(calculation_amount)
-        queries.append(self.generate_insert_query(
-            entry_id, 'calculation-1', calculation_value, date_created
-        ))
-        
-        # 5. Calculation-2 field (always present - stripe amount)
-        calculation2_value = self.php_serialize_calculation(float(stripe_amount))
-        queries.append(self.generate_insert_query(
-            entry_id, 'calculation-2', calculation2_value, date_created
-        ))
+        return self._context_inserts(self._entry_context(entry))
+    
+    @staticmethod
+    def _entry_context(entry: Dict) -> _EntryContext:
+        """
+        Collect the values of a form entry from an entry dictionary.
         
-        # 6. Name field (name-1) - PHP serialized array
-        name_value = self.php_serialize_name(first_name, last_name)
-        queries.append(self.generate_insert_query(
-            entry_id, 'name-1', name_value, date_created
-        ))
+        The dictionary has the generate_entry_inserts() parameters as keys;
+        optional ones that are missing take the same defaults.
+        """
+        date_created = entry.get('date_created')
+        if date_created is None:
+            date_created = _now()
+        gender = entry['gender']
+        
+        return _EntryContext(
+            entry_id=entry['entry_id'],
+            date_created=date_created,
+            # An empty date_created falls back to today's date, as before the cached helper
+            submission_date=(_submission_date(date_created) if date_created
+                             else datetime.now().strftime('%d/%m/%Y')),
+            first_name=entry['first_name'],
+            last_name=entry['last_name'],
+            email=entry['email'],
+            phone=entry['phone'],
+            grade=entry['grade'],
+            dojo_name=entry['dojo_name'],
+            birth_date=entry['birth_date'],
+            gender_value=_GENDER_MAP.get(gender, gender),  # Use mapped value or original if not M/F
+            stripe_transaction_id=entry['stripe_transaction_id'],
+            stripe_amount=entry['stripe_amount'],
+            party=entry.get('party', False),
+            t_shirt=entry.get('t_shirt', False),
+            t_shirt_size=entry.get('t_shirt_size'),
+            ffst_id=entry.get('ffst_id'),
+            party_participants=entry.get('party_participants', "1"),
+            currency=entry.get('currency', "EUR"),
+        )
+    
+    def _entry_plan(self, ctx: _EntryContext) -> Tuple[Tuple[str, Callable[[_EntryContext], str]], ...]:
+        """
+        Return the (meta_key, value builder) pairs of the schema fields included for an entry.
         
-        # 7. Email field (email-1)
-        queries.append(self.generate_insert_query(
-            entry_id, 'email-1', email, date_created
-        ))
+        Inclusion only depends on the entry options, so the filtered schema is
+        computed once per combination of options and reused.
+        """
+        # The _ENTRY_SCHEMA predicates only read party, t_shirt, t_shirt_size and
+        # ffst_id: a predicate reading another field must be added to this key
+        key = (bool(ctx.party), bool(ctx.t_shirt), bool(ctx.t_shirt_size), bool(ctx.ffst_id))
+        plan = self._ENTRY_PLANS.get(key)
+        if plan is None:
+            plan = tuple(
+                (meta_key, value_fn)
+                for meta_key, value_fn, predicate in self._ENTRY_SCHEMA
+                if predicate is None or predicate(ctx)
+            )
+            self._ENTRY_PLANS[key] = plan
+        return plan
+    
+    def _context_fields(self, ctx: _EntryContext) -> List[Tuple[str, str]]:
+        """Generate the (meta_key, meta_value) pairs of an entry context."""
+        return [(meta_key, value_fn(ctx)) for meta_key, value_fn in self._entry_plan(ctx)]
+    
+    def _context_inserts(self, ctx: _EntryContext) -> List[str]:
+        """Generate the INSERT queries of an entry context, one per field."""
+        return [
+            self.generate_insert_query(ctx.entry_id, meta_key, meta_value, ctx.date_created)
+            for meta_key, meta_value in self._context_fields(ctx)
+        ]
+    
+    def generate_entry_fields(self, entry: Dict) -> List[Tuple[str, str]]:
+        """
+        Generate the (meta_key, meta_value) pairs of a complete form entry.
         
-        # 8. Phone field (phone-1)
-        queries.append(self.generate_insert_query(
-            entry_id, 'phone-1', phone, date_created
-        ))
+        Args:
+            entry: Entry dictionary with the generate_entry_inserts() parameters as keys
         
-        # 9. Grade field (select-1)
-        queries.append(self.generate_insert_query(
-            entry_id, 'select-1', grade, date_created
-        ))
+        Returns:
+            List of (meta_key, meta_value) tuples, in insertion order
+        """
+        return self._context_fields(self._entry_context(entry))
+    
+    def generate_entry_inserts_bytes(self, entry: Dict) -> bytearray:
+        """
+        Generate all INSERT queries for a complete form entry as UTF-8 encoded bytes.
         
-        # 10. Dojo Name field (text-3)
-        queries.append(self.generate_insert_query(
-            entry_id, 'text-3', dojo_name, date_created
-        ))
+        Same queries as generate_entry_inserts(), one per line, ready to be
+        written to a binary stream (e.g. sys.stdout.buffer) without a final
+        encoding pass.
         
-        # 11. Birth Date field (date-1)
-        queries.append(self.generate_insert_query(
-            entry_id, 'date-1', birth_date, date_created
-        ))
+        Args:
+            entry: Entry dictionary with the generate_entry_inserts() parameters as keys
         
-        # 12. Gender field (select-2) - only when t_shirt is True
-        if t_shirt:
-            queries.append(self.generate_insert_query(
-                entry_id, 'select-2', gender_value, date_created
+        Returns:
+            Buffer of newline-terminated MySQL INSERT queries
+        """
+        return self._context_inserts_bytes(self._entry_context(entry))
+    
+    def _context_inserts_bytes(self, ctx: _EntryContext) -> bytearray:
+        """Generate the UTF-8 encoded INSERT queries of an entry context."""
+        prefix = self._INSERT_PREFIX_BYTES + str(ctx.entry_id).encode('utf-8')
+        suffix = ctx.date_created.encode('utf-8') + self._INSERT_SUFFIX_BYTES + b'\n'
+        
+        buf = bytearray()
+        for meta_key, value_fn in self._entry_plan(ctx):
+            # Serialized fields are built as bytes directly, the others are encoded
+            bytes_fn = self._ENTRY_SCHEMA_BYTES.get(meta_key)
+            meta_value = bytes_fn(ctx) if bytes_fn is not None else value_fn(ctx).encode('utf-8')
+            buf += b''.join((
+                prefix, self._META_KEY_FRAGMENTS_BYTES[meta_key],
+                self.escape_sql_bytes(meta_value), b"', '", suffix
             ))
+        return buf
+    
+    def generate_entry_insert_batched(self, entry: Dict, batch_size: int = 1000) -> List[str]:
+        """
+        Generate multi-row INSERT queries for a complete form entry.
         
-        # 13. T-Shirt Size field (select-3) - only when t_shirt is True and t_shirt_size is provided
-        if t_shirt and t_shirt_size:
-            queries.append(self.generate_insert_query(
-                entry_id, 'select-3', t_shirt_size, date_created
-            ))
+        Args:
+            entry: Entry dictionary with the generate_entry_inserts() parameters as keys
+            batch_size: Maximum number of rows per INSERT query
         
-        # 14. Select-4 field (conditional - only when t_shirt is True)
-        if t_shirt:
-            queries.append(self.generate_insert_query(
-                entry_id, 'select-4', '1', date_created
-            ))
+        Returns:
+            List of MySQL INSERT query strings (a single query unless batch_size is exceeded)
+        """
+        return self.generate_batched_insert_queries(
+            self._context_rows(self._entry_context(entry)), batch_size
+        )
+    
+    def _context_rows(self, ctx: _EntryContext) -> List[str]:
+        """Generate the VALUES rows of an entry context."""
+        return [
+            self.generate_values_row(ctx.entry_id, meta_key, meta_value, ctx.date_created)
+            for meta_key, meta_value in self._context_fields(ctx)
+        ]
+    
+    def generate_entry_param_rows(self, entry: Dict) -> Tuple[str, List[Tuple[int, str, str, str]]]:
+        """
+        Generate a parameterized INSERT query and its parameter rows for a complete form entry.
         
-        # 15. Select-5 field
-        if party:
-            queries.append(self.generate_insert_query(
-                entry_id, 'select-5', party_participants, date_created
-            ))
+        Values are bound by the database driver, so no SQL escaping is done:
         
-        # 16. Checkbox-2 field (optional - party and/or t-shirt)
-        if party or t_shirt:
-            checkbox_values = []
-            if party:
-                checkbox_values.append('Fête Finale / Final Party')
-            if t_shirt:
-                checkbox_values.append('T-Shirt')
-            checkbox_value = ', '.join(checkbox_values)
-            queries.append(self.generate_insert_query(
-                entry_id, 'checkbox-2', checkbox_value, date_created
-            ))
+            query, rows = generator.generate_entry_param_rows(entry)
+            cursor.executemany(query, rows)
         
-        # 17. Stripe payment field (stripe-ocs-1) - PHP serialized array
-        stripe_value = self.php_serialize_stripe(stripe_transaction_id, stripe_amount, currency)
-        queries.append(self.generate_insert_query(
-            entry_id, 'stripe-ocs-1', stripe_value, date_created
-        ))
+        Args:
+            entry: Entry dictionary with the generate_entry_inserts() parameters as keys
         
-        return queries
+        Returns:
+            Tuple of the query (with %s placeholders) and a list of
+            (entry_id, meta_key, meta_value, date_created) parameter tuples
+        """
+        ctx = self._entry_context(entry)
+        rows = [
+            (ctx.entry_id, meta_key, meta_value, ctx.date_created)
+            for meta_key, meta_value in self._context_fields(ctx)
+        ]
+        return self.PARAM_INSERT_QUERY, rows
+    
+    def _iter_entries(self, entries: Iterable[Dict]) -> Iterator[Dict]:
+        """Yield entry dictionaries, with a date_created for all of them."""
+        # Entries without a date_created share a single timestamp for the whole run
+        now = _now()
+        for entry in entries:
+            if entry.get('date_created') is None:
+                entry = dict(entry, date_created=now)
+            yield entry
     
-    def generate_multiple_entries(self, entries: List[Dict]) -> List[str]:
+    def _iter_entry_rows(self, entries: Iterable[Dict]) -> Iterator[str]:
+        """Yield the VALUES rows of all fields of the given entry dictionaries."""
+        for entry in self._iter_entries(entries):
+            yield from self._context_rows(self._entry_context(entry))
+    
+    def generate_multiple_entries(self, entries: List[Dict], batched: bool = True,
+                                  batch_size: int = 1000) -> List[str]:
         """
         Generate INSERT queries for multiple form entries.
         
@@ -290,33 +632,115 @@ class ForminatorInsertGenerator:
             entries: List of dictionaries containing entry data.
                     Each dict should have keys: entry_id, first_name,
                     last_name, email, phone, grade, dojo_name, birth_date, gender,
-                    stripe_transaction_id, stripe_amount, and optionally date_created, currency
+                    stripe_transaction_id, stripe_amount, and optionally party, t_shirt,
+                    t_shirt_size, ffst_id, party_participants, date_created, currency
+            batched: Emit multi-row INSERT queries (default: True). When False,
+                    one INSERT query is emitted per field, with an empty line between entries
+            batch_size: Maximum number of rows per INSERT query when batched
         
         Returns:
             List of all MySQL INSERT query strings
         """
-        all_queries = []
+        if not batched:
+            all_queries = []
+            for entry in self._iter_entries(entries):
+                all_queries.extend(self._context_inserts(self._entry_context(entry)))
+                all_queries.append('')  # Add empty line between entries
+            return all_queries
+        
+        rows = list(self._iter_entry_rows(entries))
+        return self.generate_batched_insert_queries(rows, batch_size)
+    
+    def generate_multiple_entries_bytes(self, entries: List[Dict], max_workers: Optional[int] = None,
+                                        parallel_threshold: Optional[int] = None) -> bytes:
+        """
+        Generate INSERT queries for multiple form entries as UTF-8 encoded bytes.
         
-        for entry in entries:
-            queries = self.generate_entry_inserts(
-                entry_id=entry['entry_id'],
-                first_name=entry['first_name'],
-                last_name=entry['last_name'],
-                email=entry['email'],
-                phone=entry['phone'],
-                grade=entry['grade'],
-                dojo_name=entry['dojo_name'],
-                birth_date=entry['birth_date'],
-                gender=entry['gender'],
-                stripe_transaction_id=entry['stripe_transaction_id'],
-                stripe_amount=entry['stripe_amount'],
-                date_created=entry.get('date_created'),
-                currency=entry.get('currency', 'EUR')
-            )
-            all_queries.extend(queries)
-            all_queries.append('')  # Add empty line between entries
+        One query per line with an empty line between entries, as with
+        write_multiple_entries(batched=False). Entries are independent, so
+        above parallel_threshold entries they are rendered in chunks by a
+        pool of worker processes, when more than one worker is available.
+        
+        Args:
+            entries: List of entry dictionaries, see generate_multiple_entries()
+            max_workers: Number of worker processes (defaults to the CPU count)
+            parallel_threshold: Number of entries above which worker processes
+                    are used (defaults to PARALLEL_THRESHOLD)
+        
+        Returns:
+            MySQL INSERT queries
+        """
+        entries = list(self._iter_entries(entries))
+        
+        if parallel_threshold is None:
+            parallel_threshold = self.PARALLEL_THRESHOLD
+        workers = max_workers or os.cpu_count() or 1
+        
+        # A single worker process only adds the pool overhead
+        if workers < 2 or len(entries) <= parallel_threshold:
+            return _render_chunk(entries)
         
-        return all_queries
+        chunk_size = -(-len(entries) // workers)  # Ceiling division
+        chunks = [
+            entries[start:start + chunk_size]
+            for start in range(0, len(entries), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return b''.join(executor.map(_render_chunk, chunks, chunksize=1))
+    
+    def write_multiple_entries(self, entries: Iterable[Dict], out: TextIO, batched: bool = True,
+                               batch_size: int = 1000) -> int:
+        """
+        Stream INSERT queries for multiple form entries to a text stream.
+        
+        Queries are written as soon as they are complete instead of being
+        accumulated in memory, one query per line.
+        
+        Args:
+            entries: Entry dictionaries, see generate_multiple_entries()
+            out: Writable text stream (e.g. sys.stdout or an open file)
+            batched: Emit multi-row INSERT queries (default: True)
+            batch_size: Maximum number of rows per INSERT query when batched
+        
+        Returns:
+            Number of INSERT queries written
+        """
+        # Fail before consuming entries rather than when the first batch is written
+        if batched and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        
+        count = 0
+        
+        if not batched:
+            for entry in self._iter_entries(entries):
+                queries = self._context_inserts(self._entry_context(entry))
+                out.write('\n'.join(queries) + '\n\n')  # Add empty line between entries
+                count += len(queries)
+            return count
+        
+        rows = []
+        for row in self._iter_entry_rows(entries):
+            rows.append(row)
+            if len(rows) == batch_size:
+                out.write(self.generate_batched_insert_queries(rows, batch_size)[0] + '\n')
+                count += 1
+                rows.clear()
+        
+        if rows:
+            out.write(self.generate_batched_insert_queries(rows, batch_size)[0] + '\n')
+            count += 1
+        
+        return count
+
+
+def _render_chunk(entries: List[Dict]) -> bytes:
+    """Render the INSERT queries of a chunk of entry dictionaries, run in worker processes."""
+    generator = ForminatorInsertGenerator()
+    buf = bytearray()
+    for entry in entries:
+        buf += generator._context_inserts_bytes(generator._entry_context(entry))
+        buf += b'\n'  # Add empty line between entries
+    return bytes(buf)
 
 
 def main():
@@ -349,12 +773,11 @@ def main():
     
     # Print the queries
     print("-- Forminator Form Entry Meta INSERT Queries")
-    print(f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"-- Generated: {_now()}")
     print(f"-- Entry ID: {example_entry['entry_id']}")
     print()
     
-    for query in queries:
-        print(query)
+    sys.stdout.write('\n'.join(queries) + '\n')
     
     print()
     print(f"-- Total queries generated: {len(queries)}")
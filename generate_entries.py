@@ -4,6 +4,7 @@ Example usage of the ForminatorInsertGenerator.
 Demonstrates how to generate MySQL INSERT queries for Forminator form entries.
 """
 
+import sys
 from datetime import datetime
 from forminator_insert_generator import ForminatorInsertGenerator
 
@@ -43,8 +44,7 @@ def main():
     print(f"-- Entry ID: {example_entry['entry_id']}")
     print()
     
-    for query in queries:
-        print(query)
+    sys.stdout.write('\n'.join(queries) + '\n')
     
     print()
     print(f"-- Total queries generated: {len(queries)}")